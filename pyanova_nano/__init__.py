@@ -1,5 +1,17 @@
-from pyanova_nano.client import PyAnova
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyanova_nano.client import PyAnova
 
 __all__ = [
     "PyAnova",
 ]
+
+
+def __getattr__(name: str):
+    """Defer importing the client (and the protobuf stack behind it)."""
+    if name == "PyAnova":
+        from pyanova_nano.client import PyAnova
+
+        return PyAnova
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
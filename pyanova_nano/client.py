@@ -14,6 +14,7 @@ from bleak import BLEDevice
 from bleak import BleakClient
 from bleak import BleakError
 from bleak import BleakScanner
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak_retry_connector import BleakClientWithServiceCache
 from bleak_retry_connector import MAX_CONNECT_ATTEMPTS
 from bleak_retry_connector import establish_connection
@@ -21,9 +22,9 @@ from google.protobuf.message import DecodeError
 
 from pyanova_nano.commands import COMMANDS_MAP
 from pyanova_nano.commands import convert_buffer
-from pyanova_nano.commands import create_command_array
+from pyanova_nano.commands import encode_write_command
+from pyanova_nano.commands import is_buffer_complete
 from pyanova_nano.proto.messages_pb2 import IntegerValue
-from pyanova_nano.proto.messages_pb2 import SensorValue
 from pyanova_nano.proto.messages_pb2 import UnitType
 from pyanova_nano.types import Commands
 from pyanova_nano.types import MessageTypes
@@ -33,6 +34,15 @@ from pyanova_nano.types import WriteCommands
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIT_TABLE: dict[int, Tuple[str, int]] = {
+    UnitType.DEGREES_C: ("C", 1),
+    UnitType.DEGREES_POINT_1C: ("C", 10),
+    UnitType.DEGREES_POINT_01C: ("C", 100),
+    UnitType.DEGREES_F: ("F", 1),
+    UnitType.DEGREES_POINT_1F: ("F", 10),
+    UnitType.DEGREES_POINT_01F: ("F", 100),
+}
+
 
 class PyAnova:
     """Client for the Anova Nano sous vide cooker.
@@ -47,8 +57,17 @@ class PyAnova:
 
         >>> asyncio.run(print_device_sensors())
 
+    Note:
+        The client works on any asyncio event loop and no longer captures
+        the loop at construction time. To reduce event loop overhead an
+        alternative implementation such as uvloop can be installed as the
+        loop policy before running:
+
+        >>> asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # doctest: +SKIP
+
     Args:
-        loop: The active asyncio event loop.
+        loop: Deprecated and ignored. The running loop is looked up on
+            demand, so the client can be created before the loop starts.
         device: An optional bleak.BLEDevice to connect to.
 
     """
@@ -69,28 +88,34 @@ class PyAnova:
         device: Optional[BLEDevice] = None,
         discover_timeout: int = 10,
     ):
-        self._loop = loop or asyncio.get_running_loop()
-        assert self._loop, "Must create an event loop first."
-
         self._scanner: Optional[BleakScanner] = None
+        self._scanner_use_bdaddr: Optional[bool] = None
+        self._detection_callback: Optional[Callable] = None
         self._device: Optional[BLEDevice] = device
         self._client: Optional[BleakClient] = None
 
+        # Characteristics resolved once per connection to avoid a UUID
+        # lookup on every GATT operation.
+        self._char_write: Optional[BleakGATTCharacteristic] = None
+        self._char_read: Optional[BleakGATTCharacteristic] = None
+
         self._discover_timeout: int = discover_timeout
-        self._scanning = asyncio.Event()
+        self._device_found = asyncio.Event()
+        self._discovered_devices: dict[str, BLEDevice] = {}
 
         self._connect_lock = asyncio.Lock()
         self._command_lock = asyncio.Lock()
 
         self.__future_received: Future | None = None
-        self.__result_received = bytearray()
+        self.__chunks_received: List[bytes] = []
 
-        self._callbacks_disconnect: List[Callable] = []
+        self._callbacks_disconnect: dict[int, Callable] = {}
 
         # Polling
         self._last_sensor_values: Optional[SensorValues] = None
+        self._last_sensor_values_ts: float = 0.0
         self._poll_interval: int = 30
-        self._callbacks: List[Callable] = []
+        self._callbacks: dict[int, Callable] = {}
         self._stop = False
         self._is_poll_started = False
         self._task: Optional[Future] = None
@@ -154,9 +179,6 @@ class PyAnova:
     async def _connect(self, device, timeout_seconds: int | None = None):
         timeout_seconds = timeout_seconds or self._CONNECT_TIMEOUT_SEC
 
-        if self.is_connected():
-            return
-
         async with self._connect_lock:
             if self.is_connected():
                 return
@@ -178,9 +200,11 @@ class PyAnova:
             if not self._client.is_connected:
                 await self._client.connect()
 
-            await self._client.start_notify(
-                self.CHARACTERISTICS_READ, self._on_data_received
-            )
+            services = self._client.services
+            self._char_write = services.get_characteristic(self.CHARACTERISTICS_WRITE)
+            self._char_read = services.get_characteristic(self.CHARACTERISTICS_READ)
+
+            await self._client.start_notify(self._char_read, self._on_data_received)
 
     async def __aenter__(self):
         await self.connect()
@@ -203,29 +227,29 @@ class PyAnova:
 
         """
         timeout_seconds = timeout_seconds or self._discover_timeout
-        detection_callback = (
+        self._detection_callback = (
             self._on_discovery_set_device if connect else self._on_discover_log
         )
 
-        self._scanner = scanner = BleakScanner(
-            detection_callback=detection_callback,
-            use_bdaddr=use_bdaddr,
-            # Look for any devices that provide the service uuid we need.
-            service_uuids=[self.SERVICE_UUID],
-        )
+        # Reuse the scanner across discover calls to avoid re-registering
+        # the scan filters with the OS every time.
+        if self._scanner is None or use_bdaddr != self._scanner_use_bdaddr:
+            self._scanner = BleakScanner(
+                detection_callback=self._on_detection,
+                use_bdaddr=use_bdaddr,
+                # Look for any devices that provide the service uuid we need.
+                service_uuids=[self.SERVICE_UUID],
+            )
+            self._scanner_use_bdaddr = use_bdaddr
+        scanner = self._scanner
+        self._device_found.clear()
+        self._discovered_devices.clear()
         await scanner.start()
 
-        # Stop scan the moment we found a fitting device.
-        self._scanning.set()
-        end_time = self._loop.time() + timeout_seconds
-
-        while self._scanning.is_set():
-            await asyncio.sleep(0.1)
-            if self._loop.time() < end_time:
-                continue
-
-            # Abort if we run out of time.
-            self._scanning.clear()
+        # Stop the scan the moment we found a fitting device or we run out
+        # of time.
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._device_found.wait(), timeout=timeout_seconds)
 
         await scanner.stop()
 
@@ -235,13 +259,15 @@ class PyAnova:
         if self._device and connect:
             await self._connect(self._device, timeout_seconds=self._CONNECT_TIMEOUT_SEC)
 
-        # Filter by service uuid as bleak returns everything it found.
-        devices = [
-            device
-            for device, adv in scanner.discovered_devices_and_advertisement_data.values()
-            if self.SERVICE_UUID in adv.service_uuids
-        ]
-        return devices
+        # The detection callbacks already filtered by service uuid, so no
+        # need to scan through everything bleak found once more.
+        return list(self._discovered_devices.values())
+
+    async def _on_detection(
+        self, device: BLEDevice, advertisement_data: AdvertisementData
+    ):
+        """Route detections to the callback selected by discover()."""
+        await self._detection_callback(device, advertisement_data)
 
     async def _on_discovery_set_device(
         self, device: BLEDevice, advertisement_data: AdvertisementData
@@ -258,16 +284,22 @@ class PyAnova:
 
         _LOGGER.info("Found device: %s - name: (%s)", device.address, device.name)
 
+        self._discovered_devices[device.address] = device
+
         if not self._connect_lock.locked():
-            # Stop the scan.
-            self._scanning.clear()
             self._device = device
+            # Stop the scan.
+            self._device_found.set()
 
-    @staticmethod
     async def _on_discover_log(
-        device: BLEDevice, advertisement_data: AdvertisementData
+        self, device: BLEDevice, advertisement_data: AdvertisementData
     ):
+        if self.SERVICE_UUID not in advertisement_data.service_uuids:
+            # On linux the callback is fired for every device, so we have to filter.
+            return
+
         _LOGGER.info("Found device: %s (%s)", device, device.name)
+        self._discovered_devices[device.address] = device
 
     def _on_disconnect(self, _: BleakClient):
         """Handle the device disconnecting from this client."""
@@ -281,11 +313,12 @@ class PyAnova:
              Callable to unsubscribe.
 
         """
-        self._callbacks_disconnect.append(callback)
+        key = id(callback)
+        self._callbacks_disconnect[key] = callback
 
         def _unsub() -> None:
             """Unsubscribe from device notifications."""
-            self._callbacks_disconnect.remove(callback)
+            self._callbacks_disconnect.pop(key, None)
 
         return _unsub
 
@@ -317,18 +350,28 @@ class PyAnova:
         """
         _LOGGER.debug("Received raw data array: %s", str(raw_data))
 
-        self.__result_received.extend(raw_data)
+        if self.__future_received is None:
+            # Notification outside of any pending command.
+            _LOGGER.debug("Unexpected data received: %s", str(raw_data))
+            return
+
+        self.__chunks_received.append(bytes(raw_data))
 
-        if None in convert_buffer(self.__result_received):
+        if not is_buffer_complete(raw_data):
             _LOGGER.debug(
                 "Buffer not complete yet - waiting for more data: %s",
-                str(self.__result_received),
+                str(self.__chunks_received),
             )
             return
         elif not self.__future_received.done():
-            # End of data.
-            _LOGGER.debug("Buffer complete: %s", str(self.__result_received))
-            self.__future_received.set_result(convert_buffer(self.__result_received))
+            # End of data - decode the accumulated buffer exactly once.
+            buffer = b"".join(self.__chunks_received)
+            _LOGGER.debug("Buffer complete: %s", str(buffer))
+            # Copy out of convert_buffer's shared scratch before handing
+            # the result to the awaiting coroutine: parsing happens a
+            # scheduling hop later, and another client on the same loop
+            # could overwrite the scratch in between.
+            self.__future_received.set_result(bytes(convert_buffer(buffer)))
         else:
             # Buffer was completed - but we received more data.
             _LOGGER.debug("Unexpected data received: %s", str(raw_data))
@@ -339,40 +382,57 @@ class PyAnova:
         value: Optional[IntegerValue] = None,
     ) -> Union[None, MessageTypes]:
         """Send a command to the device."""
+        async with self._command_lock:
+            return await self._send_command_locked(command, value)
+
+    async def send_commands_batch(
+        self, commands: List[ReadCommands]
+    ) -> List[MessageTypes]:
+        """Send multiple read commands under a single lock acquisition.
+
+        The device answers strictly in request order, so the replies map
+        1:1 onto the requested commands.
+
+        """
+        async with self._command_lock:
+            return [
+                await self._send_command_locked(command, None) for command in commands
+            ]
+
+    async def _send_command_locked(
+        self,
+        command: Commands,
+        value: Optional[IntegerValue] = None,
+    ) -> Union[None, MessageTypes]:
+        """Send a single command; the caller must hold _command_lock."""
         _LOGGER.debug("Sending command: %s", str(command))
         command_config = COMMANDS_MAP[command]
-        command_instruction = command_config["instruction"]
-        command_array = create_command_array(command_instruction, value)
+        if value is None:
+            # Read commands are precomputed - no need to re-serialize.
+            command_array = command_config["encoded"]
+        else:
+            command_array = encode_write_command(command, value.value)
         handler = command_config.get("handler")
 
-        await self._command_lock.acquire()
-        self.__future_received = self._loop.create_future()
-        self.__result_received = bytearray()
+        self.__future_received = asyncio.get_running_loop().create_future()
+        self.__chunks_received = []
 
-        try:
-            # Request the data.
-            _LOGGER.debug("Sending command array: %s", str(command_array))
-            await self._client.write_gatt_char(
-                self.CHARACTERISTICS_WRITE, bytes(command_array), response=True
-            )
-        except Exception:
-            self._command_lock.release()
-            raise
+        # Request the data.
+        _LOGGER.debug("Sending command array: %s", str(command_array))
+        await self._client.write_gatt_char(
+            self._char_write, command_array, response=True
+        )
 
         if not handler:
-            self._command_lock.release()
-            return
+            return None
 
-        try:
-            async with asyncio.timeout(self._READ_DATA_TIMEOUT_SEC):
-                await self.__future_received
-        finally:
-            self._command_lock.release()
+        async with asyncio.timeout(self._READ_DATA_TIMEOUT_SEC):
+            await self.__future_received
 
         result = self.__future_received.result()
         _LOGGER.debug("Received data: %s", result)
         try:
-            message = handler.FromString(bytes(result))
+            message = handler.FromString(result)
         except DecodeError:
             # TODO: Add error handling.
             raise
@@ -386,30 +446,62 @@ class PyAnova:
              Callable to unsubscribe.
 
         """
-        self._callbacks.append(callback)
+        key = id(callback)
+        self._callbacks[key] = callback
 
         def _unsub() -> None:
             """Unsubscribe from device notifications."""
-            self._callbacks.remove(callback)
+            self._callbacks.pop(key, None)
 
         return _unsub
 
-    def _fire_callbacks(self, callbacks: List[Callable]):
+    def _fire_callbacks(self, callbacks: dict[int, Callable]):
         """Execute all callbacks."""
         # Catch errors to not have one callback stop another from being executed.
-        for callback in callbacks:
+        # The tuple snapshot keeps dispatch safe against unsubscription from
+        # within a callback.
+        for callback in tuple(callbacks.values()):
             try:
                 callback()
             except Exception as e:
                 _LOGGER.exception(e)
 
+    async def _fire_callbacks_async(self, callbacks: dict[int, Callable]):
+        """Execute all callbacks, running coroutine callbacks concurrently."""
+        coros = []
+        for callback in tuple(callbacks.values()):
+            if asyncio.iscoroutinefunction(callback):
+                coros.append(callback())
+                continue
+
+            # Catch errors to not have one callback stop another from being
+            # executed.
+            try:
+                callback()
+            except Exception as e:
+                _LOGGER.exception(e)
+
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for error in results:
+                if isinstance(error, Exception):
+                    # Not inside an except block, so pass the exception
+                    # explicitly to get its traceback logged.
+                    _LOGGER.error("Callback failed", exc_info=error)
+
     async def _poll(self):
         """Repeatedly poll the device status and fire callbacks."""
+        # Anchor the cadence to the loop clock so the BLE round-trip time
+        # does not add to the interval and drift the schedule.
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time() + self._poll_interval
+
         while self.is_connected():
             await self.get_sensor_values()
-            self._fire_callbacks(self._callbacks)
+            await self._fire_callbacks_async(self._callbacks)
 
-            await asyncio.sleep(self._poll_interval)
+            await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+            next_deadline += self._poll_interval
 
     def start_poll(self, poll_interval: int | None = None):
         """Start polling the device for updates.
@@ -444,52 +536,42 @@ class PyAnova:
     @staticmethod
     def _get_unit_and_factor(unit: int) -> Tuple[str, int]:
         """Convert the unit into a readable format."""
-        if unit == UnitType.DEGREES_C:
-            return "C", 1
-        elif unit == UnitType.DEGREES_POINT_1C:
-            return "C", 10
-        elif unit == UnitType.DEGREES_POINT_01C:
-            return "C", 100
-        elif unit == UnitType.DEGREES_F:
-            return "F", 1
-        elif unit == UnitType.DEGREES_POINT_1F:
-            return "F", 10
-        elif unit == UnitType.DEGREES_POINT_01F:
-            return "F", 100
-
-        raise ValueError(f"Unknown unit type: {unit}")
+        try:
+            return _UNIT_TABLE[unit]
+        except KeyError:
+            raise ValueError(f"Unknown unit type: {unit}") from None
 
     async def get_sensor_values(self) -> SensorValues:
         """Return the current status of the device."""
         sensor_value_list = await self.send_read_command(ReadCommands.GetSensorValues)
-        values = iter(sensor_value_list.values)
+        return self._parse_sensor_values(sensor_value_list)
+
+    def _parse_sensor_values(self, sensor_value_list) -> SensorValues:
+        """Convert a SensorValueList message and update the cached values."""
+        (
+            water_temp,
+            heater_temp,
+            triac_temp,
+            _unused_temp,
+            internal_temp,
+            water_low,
+            water_leak,
+            motor_speed,
+        ) = sensor_value_list.values
 
-        water_temp: SensorValue = next(values)
         water_temp_units, water_temp_factor = self._get_unit_and_factor(
             water_temp.units
         )
-
-        heater_temp: SensorValue = next(values)
         heater_temp_units, heater_temp_factor = self._get_unit_and_factor(
             heater_temp.units
         )
-
-        triac_temp: SensorValue = next(values)
         triac_temp_units, triac_temp_factor = self._get_unit_and_factor(
             triac_temp.units
         )
-
-        _unused_temp: SensorValue = next(values)
-
-        internal_temp: SensorValue = next(values)
         internal_temp_units, internal_temp_factor = self._get_unit_and_factor(
             internal_temp.units
         )
 
-        water_low: SensorValue = next(values)
-        water_leak: SensorValue = next(values)
-        motor_speed: SensorValue = next(values)
-
         sensor_values = SensorValues(
             water_temp=water_temp.value / water_temp_factor,
             water_temp_units=water_temp_units,
@@ -505,17 +587,54 @@ class PyAnova:
         )
 
         self._last_sensor_values = sensor_values
+        self._last_sensor_values_ts = asyncio.get_running_loop().time()
 
         return sensor_values
 
+    async def get_all(self) -> Tuple[SensorValues, float, int]:
+        """Read sensor values, target temperature and timer in one batch.
+
+        The three read commands share a single command lock acquisition,
+        so mixed consumers get a consistent snapshot without per-call
+        locking overhead.
+
+        Returns:
+            Tuple of the sensor values, the target temperature and the
+            remaining timer minutes.
+
+        """
+        sensor_value_list, setpoint, timer = await self.send_commands_batch(
+            [
+                ReadCommands.GetSensorValues,
+                ReadCommands.ReadTargetTemp,
+                ReadCommands.ReadTimer,
+            ]
+        )
+        sensor_values = self._parse_sensor_values(sensor_value_list)
+        return sensor_values, setpoint.value / 10, timer.value
+
     async def get_status(self) -> str:
         """Return the current device status (either stopped or running)."""
-        self._last_status = await self.send_read_command(ReadCommands.Status)
-        print(self._last_status)
-        return "stopped" if self._last_sensor_values.motor_speed == 0 else "running"
+        sensor_values = await self.get_sensor_values()
+        return "stopped" if sensor_values.motor_speed == 0 else "running"
+
+    async def get_current_temperature(self, staleness_sec: float = 1.0) -> float:
+        """Return the current temperature.
+
+        Args:
+            staleness_sec: While polling is active, reuse the last polled
+                sensor values if they are younger than this many seconds
+                instead of issuing another BLE read.
+
+        """
+        if (
+            self._is_poll_started
+            and self._last_sensor_values is not None
+            and asyncio.get_running_loop().time() - self._last_sensor_values_ts
+            < staleness_sec
+        ):
+            return self._last_sensor_values.water_temp
 
-    async def get_current_temperature(self) -> float:
-        """Return the current temperature."""
         return (await self.get_sensor_values()).water_temp
 
     async def get_target_temperature(self) -> float:
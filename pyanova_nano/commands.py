@@ -1,4 +1,4 @@
-from typing import List
+from functools import lru_cache
 from typing import Optional
 
 from pyanova_nano.proto import messages_pb2
@@ -8,28 +8,22 @@ from pyanova_nano.types import WriteCommands
 
 
 def encode_command(buffer: bytes, i: bool) -> bytes:
-    result = [0]
-    last_value = 0
-    current_index = 1
-
-    def reset_index(is_end: bool):
-        nonlocal last_value
-        nonlocal current_index
-        result[last_value] = current_index
-        last_value = len(result)
-        if is_end:
-            result.append(0)
-        current_index = 1
-
-    for u in range(len(buffer)):
-        if buffer[u] == 0:
-            reset_index(True)
-        else:
-            result.append(buffer[u])
-            current_index += 1
-            if current_index == 255:
-                reset_index(True)
-    reset_index(False)
+    """Encode the buffer so that it contains no zero bytes.
+
+    Zero bytes are removed by splitting the data into blocks prefixed
+    with their length; blocks are capped at 254 payload bytes. Splitting
+    and copying happen through C-level bytes operations instead of a
+    per-byte Python loop.
+
+    """
+    result = bytearray()
+    for segment in bytes(buffer).split(b"\x00"):
+        while len(segment) >= 254:
+            result.append(255)
+            result += segment[:254]
+            segment = segment[254:]
+        result.append(len(segment) + 1)
+        result += segment
     if i:
         result.append(0)
     return bytes(result)
@@ -39,32 +33,62 @@ def create_command_array(
     message_type: messages_pb2.ConfigDomainMessageType,
     value: Optional[IntegerValue] = None,
 ) -> bytes:
-    command = [messages_pb2.DomainType.ANOVA_DOMAIN_ID_CONFIG, message_type]
+    command = bytes((messages_pb2.DomainType.ANOVA_DOMAIN_ID_CONFIG, message_type))
     if value:
-        command.extend(list(value.SerializeToString()))
+        command += value.SerializeToString()
+
+    return encode_command(command, True)
+
+
+def is_buffer_complete(raw_data) -> bool:
+    """Return True once the closing frame delimiter has been received.
+
+    The encoded stream never contains a zero byte, so a reply is complete
+    as soon as the trailing zero delimiter shows up.
+
+    """
+    return bool(raw_data) and raw_data[-1] == 0
+
 
-    command = bytes(command)
-    command = encode_command(command, True)
+# Scratch buffer reused by convert_buffer; replies share the same few
+# shapes, so this avoids an allocation per notification.
+_SCRATCH = bytearray(256)
 
-    return command
 
+def convert_buffer(raw_data: bytearray) -> memoryview:
+    """Decode the received buffer into the raw message payload.
 
-def convert_buffer(raw_data: bytearray) -> List:
-    results = []
+    An incomplete buffer simply yields the bytes decoded so far; use
+    :func:`is_buffer_complete` to tell whether all data has arrived.
+
+    Note:
+        The returned view aliases a scratch buffer shared between calls
+        and is only valid until the next call. Parse or copy it right
+        away (the protobuf parsers copy internally).
+
+    """
     data = raw_data[:-1]
+    size = len(data)
+    # Decoding only removes block length prefixes, so the output can
+    # never outgrow the input.
+    if len(_SCRATCH) < size:
+        _SCRATCH.extend(bytes(size - len(_SCRATCH)))
+    out = _SCRATCH
     i = 0
-    while i < (len(data) - 1):
+    j = 0
+    while i < size - 1:
         block_length = data[i]
         i += 1
-        for k in range(1, block_length):
-            try:
-                results.append(data[i])
-            except IndexError:
-                results.append(None)
-            i += 1
-        if block_length < 255 and i < len(data):
-            results.append(0)
-    return results[2:]
+        if block_length:
+            # Copy the whole block in one slice.
+            block = data[i : i + block_length - 1]
+            out[j : j + len(block)] = block
+            j += len(block)
+            i += block_length - 1
+        if block_length < 255 and i < size:
+            out[j] = 0
+            j += 1
+    return memoryview(out)[2:j]
 
 
 COMMANDS_MAP = {
@@ -110,3 +134,25 @@ COMMANDS_MAP = {
         "instruction": messages_pb2.ConfigDomainMessageType.SET_COOKING_TIMER
     },
 }
+
+# Read commands carry no payload, so their encoded form never changes.
+# Attach the byte arrays to the map entries once at import time to keep
+# the serialization off the polling path.
+for _command, _config in COMMANDS_MAP.items():
+    if isinstance(_command, ReadCommands):
+        _config["encoded"] = create_command_array(_config["instruction"], None)
+del _command, _config
+
+
+@lru_cache(maxsize=64)
+def encode_write_command(command: WriteCommands, value: int) -> bytes:
+    """Return the encoded frame for a write command carrying ``value``.
+
+    Write payloads repeat a lot (the two temperature units, favourite
+    setpoints and timers), so the serialized frames are cached per
+    (command, value) pair.
+
+    """
+    message = IntegerValue()
+    message.value = value
+    return create_command_array(COMMANDS_MAP[command]["instruction"], message)
@@ -0,0 +1,11 @@
+import pytest
+
+from pyanova_nano.commands import convert_buffer
+from pyanova_nano.proto.messages_pb2 import SensorValueList
+from pyanova_nano.tests.test_commands import SENSOR_LIST_FRAME
+
+
+@pytest.fixture(scope="session")
+def decoded_sensor_value_list() -> SensorValueList:
+    """The parsed sensor value list reply, decoded once per session."""
+    return SensorValueList.FromString(convert_buffer(SENSOR_LIST_FRAME))
@@ -1,12 +1,27 @@
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
 from typing import TypeAlias
 from typing import Union
 
-from pyanova_nano.proto.messages_pb2 import FirmwareInfo
-from pyanova_nano.proto.messages_pb2 import IntegerValue
-from pyanova_nano.proto.messages_pb2 import SensorType
-from pyanova_nano.proto.messages_pb2 import SensorValueList
+if TYPE_CHECKING:
+    from pyanova_nano.proto.messages_pb2 import FirmwareInfo
+    from pyanova_nano.proto.messages_pb2 import IntegerValue
+    from pyanova_nano.proto.messages_pb2 import SensorType
+    from pyanova_nano.proto.messages_pb2 import SensorValueList
+
+_PROTO_TYPES = frozenset(
+    {"FirmwareInfo", "IntegerValue", "SensorType", "SensorValueList"}
+)
+
+
+def __getattr__(name: str):
+    """Defer loading the protobuf descriptors until a message type is used."""
+    if name in _PROTO_TYPES:
+        from pyanova_nano.proto import messages_pb2
+
+        return getattr(messages_pb2, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ReadCommands(StrEnum):
@@ -26,7 +41,7 @@ class WriteCommands(StrEnum):
     SetTimer = "SET_TIMER"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensorValues:
     water_temp: float
     water_temp_units: str
@@ -44,4 +59,6 @@ class SensorValues:
 
 
 Commands: TypeAlias = Union[ReadCommands, WriteCommands]
-MessageTypes: TypeAlias = Union[SensorType, SensorValueList, FirmwareInfo, IntegerValue]
+MessageTypes: TypeAlias = Union[
+    "SensorType", "SensorValueList", "FirmwareInfo", "IntegerValue"
+]